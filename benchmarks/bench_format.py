@@ -0,0 +1,74 @@
+# Throughput of `format_amount()` / `format_many()`.
+# use like `python3 benchmarks/bench_format.py [<rows = 1000000>]`
+
+from decimal import ROUND_HALF_EVEN, Decimal
+import random
+import sys
+import time
+
+import iso4217parse
+
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+random.seed(42)
+codes = list(iso4217parse._data().alpha3.keys())
+currencies = [random.choice(codes) for _ in range(rows)]
+amounts = [round(random.uniform(-1e6, 1e6), 2) for _ in range(rows)]
+
+iso4217parse.format_many(amounts[:1000], currencies[:1000])  # warm up index
+
+
+def best(f, repeat=3):
+    # best of `repeat` runs, timings of a single run are noisy
+    took = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        took += [time.perf_counter() - start]
+    return rows / min(took)
+
+
+def format_amount():
+    for a, c in zip(amounts, currencies):
+        iso4217parse.format_amount(a, c)
+
+
+# baseline: per-row lookup, same output as `format_amount()`
+def baseline():
+    res = []
+    for a, c in zip(amounts, currencies):
+        curr = iso4217parse.by_alpha3(c)
+        assert curr is not None
+        q = Decimal(repr(a)).quantize(
+            Decimal(1).scaleb(-curr.minor), rounding=ROUND_HALF_EVEN
+        )
+        s = "{:,.{}f}".format(abs(q), curr.minor)
+        sign = "-" if q < 0 else ""
+        if curr.symbols:
+            res += [sign + curr.symbols[0] + s]
+        else:
+            res += [sign + s + " " + curr.alpha3]
+    return res
+
+
+# lower bound: per-row lookup and format string, without rounding like
+# `to_minor_units()` and without sign handling
+def string_building():
+    for a, c in zip(amounts, currencies):
+        curr = iso4217parse.by_alpha3(c)
+        assert curr is not None
+        symbol = curr.symbols[0] if curr.symbols else curr.alpha3 + " "
+        "{}{:,.{}f}".format(symbol, a, curr.minor)
+
+
+assert baseline() == iso4217parse.format_many(amounts, currencies)
+
+print(
+    f"format_many:        {best(lambda: iso4217parse.format_many(amounts, currencies)):12,.0f} rows/s"
+)
+print(
+    f"format_many (EUR):  {best(lambda: iso4217parse.format_many(amounts, 'EUR')):12,.0f} rows/s"
+)
+print(f"format_amount:      {best(format_amount):12,.0f} rows/s")
+print(f"per-row baseline:   {best(baseline):12,.0f} rows/s")
+print(f"string building:    {best(string_building):12,.0f} rows/s")
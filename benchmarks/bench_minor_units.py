@@ -0,0 +1,37 @@
+# Throughput of `to_minor_units()` / `from_minor_units()`.
+# use like `python3 benchmarks/bench_minor_units.py [<rows = 1000000>]`
+
+from decimal import Decimal
+import random
+import sys
+import time
+
+import iso4217parse
+
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+random.seed(42)
+codes = list(iso4217parse._data().alpha3.keys())
+currencies = [random.choice(codes) for _ in range(rows)]
+amounts = [round(random.uniform(-1e6, 1e6), 2) for _ in range(rows)]
+
+iso4217parse.to_minor_units([0], "EUR")  # warm up index
+
+start = time.perf_counter()
+units = iso4217parse.to_minor_units(amounts, currencies)
+took = time.perf_counter() - start
+print(f"to_minor_units:     {rows / took:12,.0f} rows/s")
+
+start = time.perf_counter()
+iso4217parse.from_minor_units(units, currencies)
+took = time.perf_counter() - start
+print(f"from_minor_units:   {rows / took:12,.0f} rows/s")
+
+# baseline: per-row lookup and Decimal scaling
+start = time.perf_counter()
+for a, c in zip(amounts, currencies):
+    curr = iso4217parse.by_alpha3(c)
+    assert curr is not None
+    int((Decimal(str(a)) * 10**curr.minor).to_integral_value())
+took = time.perf_counter() - start
+print(f"per-row baseline:   {rows / took:12,.0f} rows/s")
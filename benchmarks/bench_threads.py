@@ -0,0 +1,45 @@
+# Throughput of `parse()` with 1 - 16 threads.
+# use like `python3 benchmarks/bench_threads.py [<rows per thread = 20000>]`
+#
+# Scaling beyond one thread requires a free-threaded build (i.e. `python3.13t`);
+# with the GIL, the throughput stays flat.
+
+from concurrent.futures import ThreadPoolExecutor
+import random
+import sys
+import sysconfig
+import threading
+import time
+
+import iso4217parse
+
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+print(f"{sys.version.split()[0]}, free-threaded build: {free_threaded}, GIL: {gil}")
+
+random.seed(42)
+data = iso4217parse._data()
+values: list = list(data.alpha3) + list(data.symbol) + list(data.code_num)
+values += ["Price is 5 €", "RD$35.8", "CA﹩15.76", "1499 CZK", "The price is ₨ 35.8 !"]
+workload = [random.choice(values) for _ in range(rows)]
+
+iso4217parse.preload()
+
+for threads in (1, 2, 4, 8, 16):
+    barrier = threading.Barrier(threads + 1)
+
+    def work(_):
+        barrier.wait()
+        for v in workload:
+            iso4217parse.parse(v)
+
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [pool.submit(work, i) for i in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for f in futures:
+            f.result()
+        took = time.perf_counter() - start
+    print(f"{threads:2d} threads: {threads * rows / took:12,.0f} parses/s")
@@ -0,0 +1,80 @@
+# The MIT License
+
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# This is a helper script to generate the localized currency names in `names/`!
+# use like `python3 gen_names.py <output-path> [<locale> ...]`
+# (run after `gen_data.py`, the output path has to contain `data.json`)
+
+# Names are taken from the CLDR data bundled with babel; for every currency
+# the display name and all plural forms are stored.
+# pip install babel
+
+import json
+from pathlib import Path
+import sys
+
+from babel import Locale
+from babel.numbers import get_currency_name
+
+LOCALES = [
+    "de",
+    "es",
+    "fr",
+    "it",
+    "ja",
+    "nl",
+    "pl",
+    "pt",
+    "ru",
+    "sv",
+    "tr",
+    "zh",
+]
+
+if len(sys.argv) < 2:
+    print(f"Use like: python3 {sys.argv[0]} <output-path> [<locale> ...]")
+    sys.exit(42)
+
+p = Path(sys.argv[1]).absolute()
+if not (p / "data.json").is_file():
+    print(f"Use like: python3 {sys.argv[0]} <output-path> [<locale> ...]")
+    sys.exit(42)
+
+locales = sys.argv[2:] or LOCALES
+
+with open(p / "data.json") as f:
+    codes = sorted(json.load(f).keys())
+
+(p / "names").mkdir(exist_ok=True)
+for locale in locales:
+    Locale.parse(locale)  # fail early for unknown locales
+    names = {}
+    for code in codes:
+        # counts to get the `one`, `few`, `many` and `other` plural forms
+        forms = [get_currency_name(code, c, locale) for c in (None, 1, 2, 5, 1.5)]
+        forms = list(dict.fromkeys(n for n in forms if n != code))
+        if forms:
+            names[code] = forms
+
+    with open(p / "names" / f"{locale}.json", "w") as f:
+        json.dump(names, f, sort_keys=True, ensure_ascii=False, indent=4)
@@ -21,22 +21,49 @@
 # THE SOFTWARE.
 
 from collections import defaultdict, namedtuple
+from collections.abc import Iterable
 from dataclasses import dataclass
-from functools import lru_cache
+from decimal import ROUND_HALF_EVEN, Decimal
+import hashlib
 import importlib.resources
 import json
+from math import floor
+import os
 import re
-from typing import Optional
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional, Sequence, Union
 
 
 __all__ = [
     "Currency",
+    "preload",
     "by_alpha3",
     "by_code_num",
     "by_symbol",
     "by_symbol_match",
     "by_country",
+    "locales",
+    "by_name",
+    "by_name_match",
+    "is_alpha3",
+    "is_code_num",
+    "is_symbol",
+    "validate_many",
+    "validator",
+    "attrs_validator",
+    "set_match_cache",
+    "match_cache_stats",
+    "MatchCacheStats",
     "parse",
+    "best",
+    "parse_many",
+    "filter_many",
+    "to_minor_units",
+    "from_minor_units",
+    "format_amount",
+    "format_many",
 ]
 
 Currency = namedtuple(
@@ -53,17 +80,82 @@ Currency = namedtuple(
 )
 
 
-@dataclass
+class _FrozenList(list):
+    """Read-only list for the `symbols` and `countries` of shared `Currency` objects
+
+    Compares, prints and serializes like a list, but raises a `TypeError` on
+    modification.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Currency lists are read-only, copy them with `list()`.")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+
+    def __reduce__(self) -> tuple:
+        return (_FrozenList, (list(self),))
+
+
+@dataclass(frozen=True)
 class Data:
     alpha3: dict[str, Currency]
-    code_num: dict[str, Currency]
-    symbol: dict[str, list[Currency]]
+    code_num: dict[int, Currency]
+    code_num_table: tuple[Optional[Currency], ...]  # all numeric codes 0 - 999
+    alpha3_bytes: dict[bytes, Currency]
+    symbol: dict[str, tuple[Currency, ...]]
     name: dict[str, Currency]
-    country: dict[str, list[Currency]]
+    country: dict[str, tuple[Currency, ...]]
+    # dense currency ids; bit `i` of a mask is set for `currencies[i]`
+    currencies: tuple[Currency, ...]
+    currency_id: dict[str, int]
+    symbol_mask: dict[str, int]
+    country_mask: dict[str, int]
 
 
+@dataclass(frozen=True)
+class Names:
+    name: dict[str, tuple[Currency, ...]]  # case folded localized name, see `_fold()`
+    pattern: re.Pattern  # all names, longest first; search in `_fold(value)`
+
+
+# Lookup tables are built lazily (once, under `_LOCK`) and never modified
+# afterwards, such that they can be read from many threads without locking.
+_LOCK = threading.RLock()
 _DATA: Optional[Data] = None
-_SYMBOLS: Optional[list[tuple[str, str]]] = None
+_SYMBOLS: Optional[tuple[tuple[str, str, re.Pattern], ...]] = None
+_BEST: Optional[dict[tuple[str, Optional[str]], Currency]] = None
+# `best()` of symbols in countries not using them, filled on demand
+_BEST_FALLBACK: dict[tuple[str, Optional[str]], Optional[Currency]] = {}
+_BEST_FALLBACK_MAX = 4096
+_NAMES: dict[str, "Names"] = {}  # by file in `names/`, see `_names()`
+_LOCALE_SHARDS: dict[str, str] = {}  # locale -> file in `names/`
+_LOCALE_SHARDS_MAX = 1024
+_MINOR: Optional[dict[Union[str, int], tuple[int, int]]] = None
+
+_ALPHA3_PATTERN = re.compile("^[A-Z]{3}$")
+
+# amounts in minor units are meant to be stored as signed 64 bit integers
+_MINOR_UNITS_MAX = 2**63 - 1
+# below, a scaled float is precise to at least 2**-12
+_FLOAT_EXACT_MAX = 2**40
+
+
+def _rank(d: Currency) -> tuple[int, int, int]:
+    return (
+        int(d.symbols == []),  # at least one symbol
+        10000 if d.code_num is None else d.code_num,  # official first
+        len(d.countries),  # the fewer countries the more specific
+    )
+
+
+def _best_rank(d: Currency, with_country: bool) -> tuple[int, int, int]:
+    return (
+        int(d.symbols == []),  # at least one symbol
+        int(d.code_num is None),  # official first
+        # within a country the more specific, otherwise the more widely used
+        len(d.countries) if with_country else -len(d.countries),
+    )
 
 
 def _data() -> Data:
@@ -76,11 +168,31 @@ def _data() -> Data:
         Dict[str, Dict[str, Any]]: Currency data indexed by different angles
     """
     global _DATA
-    if _DATA is None:
-        with importlib.resources.open_text("iso4217parse", "data.json") as f:
-            alpha3 = {k: Currency(**v) for k, v in json.load(f).items()}
+    if _DATA is not None:
+        return _DATA
+
+    with _LOCK:
+        if _DATA is not None:
+            return _DATA
+
+        data = importlib.resources.files("iso4217parse").joinpath("data.json")
+        with data.open(encoding="utf-8") as f:
+            alpha3 = {
+                k: Currency(
+                    **dict(
+                        v,
+                        symbols=_FrozenList(v["symbols"]),
+                        countries=_FrozenList(v["countries"]),
+                    )
+                )
+                for k, v in json.load(f).items()
+            }
 
         code_num = {d.code_num: d for d in alpha3.values() if d.code_num is not None}
+        code_num_table: list[Optional[Currency]] = [None] * 1000
+        for n, d in code_num.items():
+            code_num_table[n] = d
+        alpha3_bytes = {k.encode("ascii"): d for k, d in alpha3.items()}
         symbol: dict[str, list[Currency]] = defaultdict(list)
         for d in alpha3.values():
             for s in d.symbols:
@@ -103,40 +215,153 @@ def _data() -> Data:
                 country[cc] += [d]
 
         for s, ds in country.items():
-            country[s] = sorted(
-                ds,
-                key=lambda d: (
-                    int(d.symbols == []),  # at least one symbol
-                    10000 if d.code_num is None else d.code_num,  # official first
-                    len(d.countries),  # the fewer countries the more specific
-                ),
-            )
+            country[s] = sorted(ds, key=_rank)
+
+        # ordered like the symbol index, such that masks decode in the same order
+        currencies = sorted(
+            alpha3.values(), key=lambda d: 10000 if d.code_num is None else d.code_num
+        )
+        currency_id = {d.alpha3: i for i, d in enumerate(currencies)}
+        symbol_mask = {
+            s: sum(1 << currency_id[d.alpha3] for d in ds) for s, ds in symbol.items()
+        }
+        country_mask = {
+            cc: sum(1 << currency_id[d.alpha3] for d in ds)
+            for cc, ds in country.items()
+        }
+
         _DATA = Data(
-            alpha3=alpha3, code_num=code_num, symbol=symbol, name=name, country=country
+            alpha3=alpha3,
+            code_num=code_num,
+            code_num_table=tuple(code_num_table),
+            alpha3_bytes=alpha3_bytes,
+            symbol={s: tuple(ds) for s, ds in symbol.items()},
+            name=name,
+            country={cc: tuple(ds) for cc, ds in country.items()},
+            currencies=tuple(currencies),
+            currency_id=currency_id,
+            symbol_mask=symbol_mask,
+            country_mask=country_mask,
         )
+        return _DATA
+
+
+def _from_mask(mask: int) -> list[Currency]:
+    """Decode a currency bitmask (see `Data`) to a list of currencies"""
+    currencies = _data().currencies
+    res = []
+    while mask:
+        low = mask & -mask
+        res += [currencies[low.bit_length() - 1]]
+        mask ^= low
+    return res
 
-    return _DATA
 
+def _country_filter(
+    currencies: Sequence[Currency], country_code: str
+) -> list[Currency]:
+    mask = _data().country_mask.get(country_code, 0)
+    currency_id = _data().currency_id
+    return [d for d in currencies if mask >> currency_id[d.alpha3] & 1]
 
-def _symbols() -> list[tuple[str, str]]:
+
+def _symbols() -> tuple[tuple[str, str, re.Pattern], ...]:
     """(Lazy)load list of all supported symbols (sorted)
 
     Look into `_data()` for all currency symbols, then sort by length and
-    unicode-ord (A-Z is not as relevant as ֏).
+    unicode-ord (A-Z is not as relevant as ֏). The match pattern of each
+    symbol is compiled upfront.
 
     Returns:
-        List[unicode]: Sorted list of possible currency symbols.
+        Tuple[Tuple[unicode, unicode, Pattern]]: Sorted possible currency symbols.
     """
     global _SYMBOLS
     if _SYMBOLS is None:
-        tmp = [(s, "symbol") for s in _data().symbol.keys()]
-        tmp += [(s, "alpha3") for s in _data().alpha3.keys()]
-        tmp += [(s, "name") for s in _data().name.keys()]
-        _SYMBOLS = sorted(tmp, key=lambda s: (len(s[0]), ord(s[0][0])), reverse=True)
+        with _LOCK:
+            if _SYMBOLS is None:
+                tmp = [(s, "symbol") for s in _data().symbol.keys()]
+                tmp += [(s, "alpha3") for s in _data().alpha3.keys()]
+                tmp += [(s, "name") for s in _data().name.keys()]
+                tmp = sorted(tmp, key=lambda s: (len(s[0]), ord(s[0][0])), reverse=True)
+                _SYMBOLS = tuple((s, g, _symbol_pattern(s)) for s, g in tmp)
 
     return _SYMBOLS
 
 
+def _best() -> dict[tuple[str, Optional[str]], Currency]:
+    """(Lazy)load table of the best currency per symbol and country code
+
+    For every symbol (that is not an alpha3 code) rank the currencies using it,
+    once without country and once per country they are used in, see `_best_rank()`.
+
+    Returns:
+        Dict[Tuple[unicode, Optional[unicode]], Currency]: best currency.
+    """
+    global _BEST
+    if _BEST is None:
+        with _LOCK:
+            if _BEST is None:
+                tmp: dict[tuple[str, Optional[str]], Currency] = {}
+                for s, ds in _data().symbol.items():
+                    if s in _data().alpha3:
+                        continue
+                    tmp[(s, None)] = min(
+                        ds, key=lambda d: _best_rank(d, with_country=False)
+                    )
+                    per_country: dict[str, list[Currency]] = defaultdict(list)
+                    for d in ds:
+                        for cc in d.countries:
+                            per_country[cc] += [d]
+                    for cc, cds in per_country.items():
+                        tmp[(s, cc)] = min(
+                            cds, key=lambda d: _best_rank(d, with_country=True)
+                        )
+                _BEST = tmp
+
+    return _BEST
+
+
+def _minor() -> dict[Union[str, int], tuple[int, int]]:
+    """(Lazy)load table of minor unit exponents
+
+    Index `(minor, 10 ** minor)` by alpha3 and code_num, such that the scaling
+    factor does not have to be computed per amount.
+
+    Returns:
+        Dict[Union[unicode, int], Tuple[int, int]]: minor exponent and factor.
+    """
+    global _MINOR
+    if _MINOR is None:
+        with _LOCK:
+            if _MINOR is None:
+                tmp: dict[Union[str, int], tuple[int, int]] = {}
+                for d in _data().alpha3.values():
+                    tmp[d.alpha3] = (d.minor, 10**d.minor)
+                    if d.code_num is not None:
+                        tmp[d.code_num] = (d.minor, 10**d.minor)
+                _MINOR = tmp
+
+    return _MINOR
+
+
+def preload(locales: Iterable[str] = ()) -> None:
+    """Build all lookup tables now, instead of lazily on first use
+
+    Call this once per process (or sub-interpreter) at startup, i.e. before
+    starting threads. All tables are immutable once built and shared by all
+    threads of the (sub-)interpreter; every (sub-)interpreter builds its own.
+
+    Parameters:
+        locales: Iterable[unicode]  Locales of localized names to load, see `locales()`.
+    """
+    _data()
+    _symbols()
+    _best()
+    _minor()
+    for locale in locales:
+        _names(locale)
+
+
 def by_alpha3(code: str) -> Optional[Currency]:
     """Get Currency for ISO4217 alpha3 code
 
@@ -149,16 +374,27 @@ def by_alpha3(code: str) -> Optional[Currency]:
     return _data().alpha3.get(code)
 
 
-def by_code_num(code_num: str) -> Optional[Currency]:
+def by_code_num(
+    code_num: Union[int, str, bytes, bytearray, memoryview],
+) -> Optional[Currency]:
     """Get Currency for ISO4217 numeric code
 
     Parameters:
-        code_num: int  An iso4217 numeric code.
+        code_num: Union[int, unicode, bytes]  An iso4217 numeric code; strings and
+            bytes have to consist of (at most three) ASCII digits, i.e. `b"051"`.
 
     Returns:
         Currency: return Currency object for `code_num`, if available.
     """
-    return _data().code_num.get(code_num)
+    if isinstance(code_num, memoryview):
+        code_num = code_num.tobytes()
+    if isinstance(code_num, (str, bytes, bytearray)):
+        if not (0 < len(code_num) <= 3 and code_num.isascii() and code_num.isdigit()):
+            return None
+        code_num = int(code_num)
+    if isinstance(code_num, int) and 0 <= code_num < 1000:
+        return _data().code_num_table[code_num]
+    return None
 
 
 def by_symbol(
@@ -179,19 +415,14 @@ def by_symbol(
     """
     res = _data().symbol.get(symbol)
     if res:
-        tmp_res = []
-        for d in res:
-            if country_code in d.countries:
-                tmp_res += [d]
-
-        if tmp_res:
-            return tmp_res
         if country_code is None:
-            return res
+            return list(res)
+        mask = _data().symbol_mask[symbol] & _data().country_mask.get(country_code, 0)
+        if mask:
+            return _from_mask(mask)
     return None
 
 
-@lru_cache(maxsize=1024)
 def _symbol_pattern(symbol: str) -> re.Pattern:
     symbol_pattern = re.escape(symbol)
     return re.compile(rf"(^|\b|\d|\s){symbol_pattern}([^A-Z]|$)", re.I)
@@ -209,6 +440,9 @@ def by_symbol_match(
 
     Note: This is a [heuristic](https://en.wikipedia.org/wiki/Heuristic) !
 
+    Results are looked up in / stored to the on-disk cache, if enabled with
+    `set_match_cache()`.
+
     Parameters:
         value: unicode                   Some input string.
         country_code: Optional[unicode]  Iso3166 alpha2 country code.
@@ -216,9 +450,16 @@ def by_symbol_match(
     Returns:
         List[Currency]: Currency objects found in `value`; filter by country_code.
     """
+    if _MATCH_CACHE is not None:
+        return _MATCH_CACHE.by_symbol_match(value, country_code)
+    return _by_symbol_match(value, country_code)
+
+
+def _by_symbol_match(
+    value: str, country_code: Optional[str] = None
+) -> Optional[list[Currency]]:
     res: Optional[list[Currency]] = None
-    for symbol, group in _symbols():
-        symbol_pattern = _symbol_pattern(symbol)
+    for symbol, group, symbol_pattern in _symbols():
         if symbol_pattern.search(value):
             if group == "symbol":
                 res = by_symbol(symbol, country_code)
@@ -231,15 +472,455 @@ def by_symbol_match(
                 assert curr is not None
                 res = [curr]
             if res and country_code is not None:
-                res = [
-                    currency for currency in res if country_code in currency.countries
-                ]
+                res = _country_filter(res, country_code)
             res = list(filter(None, res or []))
             if res:
                 return res
     return None
 
 
+def locales() -> list[str]:
+    """Get all locales with localized currency names
+
+    Names are derived from CLDR by `gen_names.py`; one file per locale in `names/`.
+
+    Returns:
+        List[unicode]: available locales.
+    """
+    names = importlib.resources.files("iso4217parse").joinpath("names")
+    return sorted(f.name[:-5] for f in names.iterdir() if f.name.endswith(".json"))
+
+
+def _fold(name: str) -> str:
+    # case fold; like `re.I`, do not distinguish dotted and dotless i (i.e. Turkish)
+    return name.casefold().replace("\u0131", "i").replace("i\u0307", "i")
+
+
+def _names(locale: str) -> Names:
+    """(Lazy)load localized currency names of `locale`
+
+    Only the requested locale is loaded and indexed by case folded name; a
+    `de_CH` or `de-CH` locale falls back to `de` and shares its index.
+
+    Returns:
+        Names: localized names and match pattern.
+    """
+    shard = _LOCALE_SHARDS.get(locale)
+    if shard is None:
+        shard = _locale_shard(locale)
+        if len(_LOCALE_SHARDS) < _LOCALE_SHARDS_MAX:
+            _LOCALE_SHARDS[locale] = shard
+    res = _NAMES.get(shard)
+    if res is None:
+        with _LOCK:
+            res = _NAMES.get(shard)
+            if res is None:
+                res = _NAMES[shard] = _load_names(shard)
+
+    return res
+
+
+def _locale_shard(locale: str) -> str:
+    language = locale.replace("-", "_").split("_")[0]
+    for candidate in (locale, language):
+        if candidate in locales():
+            return candidate
+    raise ValueError("Unknown locale {!r}, see `locales()`.".format(locale))
+
+
+def _load_names(shard: str) -> Names:
+    names = importlib.resources.files("iso4217parse").joinpath("names")
+    with names.joinpath(shard + ".json").open(encoding="utf-8") as f:
+        localized = json.load(f)
+
+    name: dict[str, list[Currency]] = defaultdict(list)
+    for code, ns in localized.items():
+        d = _data().alpha3[code]
+        for n in ns:
+            if d not in name[_fold(n)]:
+                name[_fold(n)] += [d]
+
+    alternatives = sorted(name.keys(), key=len, reverse=True)
+    pattern = re.compile(
+        # not within a word, but numbers may be attached; matches folded values
+        r"(?<![^\W\d_])(?:{})(?![^\W\d_])".format(
+            "|".join(map(re.escape, alternatives))
+        )
+    )
+    return Names(name={n: tuple(ds) for n, ds in name.items()}, pattern=pattern)
+
+
+def by_name(
+    name: str, locale: str, country_code: Optional[str] = None
+) -> Optional[list[Currency]]:
+    """Get currencies by their localized name (case insensitive); filter by country_code
+
+    Parameters:
+        name: unicode                    Localized currency name, i.e. `Schweizer Franken`.
+        locale: unicode                  Locale of the name, see `locales()`.
+        country_code: Optional[unicode]  Iso3166 alpha2 country code.
+
+    Returns:
+        List[Currency]: Currency objects with this name; filter by country_code.
+    """
+    res = _names(locale).name.get(_fold(name.strip()))
+    if not res:
+        return None
+    if country_code is None:
+        return list(res)
+    return _country_filter(res, country_code) or None
+
+
+def by_name_match(
+    value: str, locale: str, country_code: Optional[str] = None
+) -> Optional[list[Currency]]:
+    """Get currencies where a localized name is in value; filter by country_code
+
+    Looks for the first localized name of `locale` in `value` (the longest, if
+    several start at the same position).
+
+    Parameters:
+        value: unicode                   Some input string.
+        locale: unicode                  Locale of the names, see `locales()`.
+        country_code: Optional[unicode]  Iso3166 alpha2 country code.
+
+    Returns:
+        List[Currency]: Currency objects found in `value`; filter by country_code.
+    """
+    names = _names(locale)
+    # fold the value, not the match: folding may change the spelling (`ß` -> `ss`)
+    for m in names.pattern.finditer(_fold(value)):
+        res = names.name.get(m.group(0))
+        if res and country_code is not None:
+            res = tuple(_country_filter(res, country_code))
+        if res:
+            return list(res)
+    return None
+
+
+def _valid_alpha3(v: Any, strict: bool) -> Optional[str]:
+    if not strict:
+        if isinstance(v, (bytes, bytearray, memoryview)):
+            v = bytes(v).decode("ascii", errors="replace")
+        if isinstance(v, str):
+            v = v.strip().upper()
+    if isinstance(v, str) and v in _data().alpha3:
+        return v
+    return None
+
+
+def _valid_code_num(v: Any, strict: bool) -> Optional[int]:
+    if strict:
+        if type(v) is int and 0 <= v < 1000 and _data().code_num_table[v]:
+            return v
+        return None
+    if isinstance(v, (str, bytes, bytearray)):
+        v = v.strip()
+    elif not isinstance(v, int) and hasattr(v, "item"):
+        # e.g. numpy / pandas integer scalars
+        v = v.item()
+    if isinstance(v, bool):
+        return None
+    d = by_code_num(v)
+    return None if d is None else d.code_num
+
+
+def _valid_symbol(v: Any, strict: bool) -> Optional[str]:
+    if not strict:
+        if isinstance(v, (bytes, bytearray, memoryview)):
+            v = bytes(v).decode("utf-8", errors="replace")
+        if isinstance(v, str):
+            v = v.strip()
+    if isinstance(v, str) and v in _data().symbol:
+        return v
+    return None
+
+
+_VALIDATORS: dict[str, Callable[[Any, bool], Any]] = {
+    "alpha3": _valid_alpha3,
+    "code_num": _valid_code_num,
+    "symbol": _valid_symbol,
+}
+
+
+def _validator(kind: str) -> Callable[[Any, bool], Any]:
+    try:
+        return _VALIDATORS[kind]
+    except KeyError:
+        raise ValueError(
+            "Unknown kind {!r}, use one of {}.".format(kind, tuple(_VALIDATORS))
+        ) from None
+
+
+def is_alpha3(v: Any, strict: bool = True) -> bool:
+    """Check whether `v` is a known ISO4217 alpha3 code
+
+    Parameters:
+        v: Any         Value to check.
+        strict: bool   If False, also accept bytes, lower case and surrounding whitespace.
+
+    Returns:
+        bool: True, if valid.
+    """
+    return _valid_alpha3(v, strict) is not None
+
+
+def is_code_num(v: Any, strict: bool = True) -> bool:
+    """Check whether `v` is a known ISO4217 numeric code
+
+    Parameters:
+        v: Any         Value to check.
+        strict: bool   If True, only accept a plain `int` (no bool, float, string,
+                       or numpy integer). If False, also accept ASCII digit strings
+                       and bytes, i.e. `"051"`, and numpy / pandas integer scalars.
+
+    Returns:
+        bool: True, if valid.
+    """
+    return _valid_code_num(v, strict) is not None
+
+
+def is_symbol(v: Any, strict: bool = True) -> bool:
+    """Check whether `v` is exactly a known currency symbol (see `by_symbol()`)
+
+    Parameters:
+        v: Any         Value to check.
+        strict: bool   If False, also accept bytes and surrounding whitespace.
+
+    Returns:
+        bool: True, if valid.
+    """
+    return _valid_symbol(v, strict) is not None
+
+
+def validate_many(values: Iterable, kind: str, strict: bool = True) -> list[bool]:
+    """Check a whole column of values; see `is_alpha3()`, `is_code_num()` and `is_symbol()`
+
+    Parameters:
+        values: Iterable  Values to check.
+        kind: unicode     One of `alpha3`, `code_num` or `symbol`.
+        strict: bool      See the `is_*` functions.
+
+    Returns:
+        List[bool]: True for every valid value.
+    """
+    valid = _validator(kind)
+    return [valid(v, strict) is not None for v in values]
+
+
+def validator(kind: str, strict: bool = True) -> Callable[[Any], Any]:
+    """Create a validator function for schema libraries, i.e. pydantic
+
+    The validator returns the canonical value (alpha3 code, numeric code as int,
+    or symbol) and raises a `ValueError` for invalid values. With pydantic use it
+    like `Annotated[str, BeforeValidator(validator("alpha3", strict=False))]`.
+
+    Parameters:
+        kind: unicode  One of `alpha3`, `code_num` or `symbol`.
+        strict: bool   See the `is_*` functions.
+
+    Returns:
+        Callable[[Any], Any]: validator function.
+    """
+    valid = _validator(kind)
+
+    def validate(v: Any) -> Any:
+        res = valid(v, strict)
+        if res is None:
+            raise ValueError("{!r} is not a valid ISO4217 {}.".format(v, kind))
+        return res
+
+    return validate
+
+
+def attrs_validator(kind: str, strict: bool = True) -> Callable[[Any, Any, Any], None]:
+    """Create a validator for attrs, i.e. `attrs.field(validator=attrs_validator("alpha3"))`
+
+    Parameters:
+        kind: unicode  One of `alpha3`, `code_num` or `symbol`.
+        strict: bool   See the `is_*` functions.
+
+    Returns:
+        Callable[[Any, Any, Any], None]: validator raising `ValueError` for invalid values.
+    """
+    valid = _validator(kind)
+
+    def validate(instance: Any, attribute: Any, v: Any) -> None:
+        if valid(v, strict) is None:
+            raise ValueError(
+                "`{}` {!r} is not a valid ISO4217 {}.".format(attribute.name, v, kind)
+            )
+
+    return validate
+
+
+@dataclass
+class MatchCacheStats:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0  # failed reads, i.e. database locked or closed
+    lookup_seconds: float = 0.0  # time spent reading the cache
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def mean_lookup_seconds(self) -> float:
+        lookups = self.hits + self.misses
+        return self.lookup_seconds / lookups if lookups else 0.0
+
+
+# bump, if the results of `by_symbol_match()` or the cache keys change without changes of `data.json`
+_MATCH_CACHE_FORMAT = 3
+# a number with its thousands / decimal separators, i.e. `1,234.50` or `1 234,5`
+_NUMBER = re.compile(r"\d+(?:[.,'’\s]\d+)*")
+
+
+def _dataset_version() -> str:
+    data = importlib.resources.files("iso4217parse").joinpath("data.json")
+    digest = hashlib.sha256(data.read_bytes()).hexdigest()[:16]
+    return "{}-{}".format(_MATCH_CACHE_FORMAT, digest)
+
+
+class _MatchCache:
+    """sqlite backed cache of `by_symbol_match()` results
+
+    Keys are the input stripped from surrounding whitespace and with every
+    number (including its separators) collapsed to `0`, and the country code;
+    values are alpha3 codes. Neither changes the result, as numbers only act as
+    boundaries of symbols. Only if one of the few symbols containing digits
+    matches (i.e. `E.U.A.-17`), the input is kept as it is.
+
+    The database is in WAL mode, such that many processes can read concurrently.
+    All entries are dropped, when the dataset version changes; the oldest
+    entries are dropped, when there are more than `max_rows`. Any database
+    error falls back to `_by_symbol_match()`.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], max_rows: int) -> None:
+        if max_rows < 1:
+            raise ValueError(
+                "`max_rows` has to be positive, got {!r}.".format(max_rows)
+            )
+        self.stats = MatchCacheStats()
+        self._max_rows = max_rows
+        self._numbered = tuple(
+            pattern for s, _, pattern in _symbols() if _NUMBER.search(s)
+        )
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(
+            os.fspath(path), timeout=30, check_same_thread=False
+        )
+        with self._con:
+            self._con.execute("PRAGMA journal_mode=WAL")
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                "value TEXT, country TEXT, result TEXT, PRIMARY KEY (value, country))"
+            )
+            row = self._con.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            version = _dataset_version()
+            if row is None or row[0] != version:
+                self._con.execute("DELETE FROM matches")
+                self._con.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,)
+                )
+
+    def _key(self, value: str) -> str:
+        value = value.strip()
+        if any(pattern.search(value) for pattern in self._numbered):
+            return value
+        return _NUMBER.sub("0", value)
+
+    def by_symbol_match(
+        self, value: str, country_code: Optional[str]
+    ) -> Optional[list[Currency]]:
+        key = (self._key(value), country_code or "")
+        try:
+            with self._lock:
+                start = time.perf_counter()
+                row = self._con.execute(
+                    "SELECT result FROM matches WHERE value = ? AND country = ?", key
+                ).fetchone()
+                self.stats.lookup_seconds += time.perf_counter() - start
+                if row is not None:
+                    self.stats.hits += 1
+                    if row[0] is None:
+                        return None
+                    return [_data().alpha3[c] for c in json.loads(row[0])]
+                self.stats.misses += 1
+        except sqlite3.Error:
+            self.stats.errors += 1
+            return _by_symbol_match(value, country_code)
+
+        res = _by_symbol_match(value, country_code)
+        result = None if res is None else json.dumps([d.alpha3 for d in res])
+        try:
+            with self._lock, self._con:
+                cur = self._con.execute(
+                    "INSERT OR REPLACE INTO matches VALUES (?, ?, ?)", key + (result,)
+                )
+                # rowids only grow, hence at most `max_rows` rows are left
+                rowid = cur.lastrowid or 0
+                if rowid > self._max_rows:
+                    self._con.execute(
+                        "DELETE FROM matches WHERE rowid <= ?",
+                        (rowid - self._max_rows,),
+                    )
+        except sqlite3.Error:
+            self.stats.errors += 1
+        return res
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+
+
+_MATCH_CACHE: Optional[_MatchCache] = None
+
+
+def set_match_cache(
+    path: Optional[Union[str, os.PathLike]], max_rows: int = 100_000
+) -> None:
+    """Enable (or disable with `None`) the on-disk cache for `by_symbol_match()`
+
+    Results of `by_symbol_match()` (and thereby `parse()`) are stored in the
+    sqlite database at `path`, which can be shared by many processes on the
+    same machine. Amounts do not matter, i.e. `$ 1.50` and `$ 20.00` share an
+    entry. The cache is tagged with a hash of the bundled `data.json` and
+    cleared automatically, when the data changes. If the database cannot be
+    read or written (locked, read-only, disk full), symbols are matched
+    without the cache.
+
+    Parameters:
+        path: Optional[Union[unicode, PathLike]]  Database file; `None` disables the cache.
+        max_rows: int                             Keep at most this many (latest) entries.
+    """
+    global _MATCH_CACHE
+    old = _MATCH_CACHE
+    _MATCH_CACHE = None if path is None else _MatchCache(path, max_rows)
+    # other threads may still use the old cache; they fall back on errors
+    if old is not None:
+        old.close()
+
+
+def match_cache_stats() -> Optional[MatchCacheStats]:
+    """Get hit / miss counts and lookup latency of the on-disk cache
+
+    Statistics are kept per process, since `set_match_cache()`.
+
+    Returns:
+        MatchCacheStats: statistics, if the cache is enabled.
+    """
+    return None if _MATCH_CACHE is None else _MATCH_CACHE.stats
+
+
 def by_country(country_code: str) -> Optional[list[Currency]]:
     """Get all currencies used in country
 
@@ -250,36 +931,63 @@ def by_country(country_code: str) -> Optional[list[Currency]]:
         List[Currency]: Currency objects used in country.
 
     """
-    return _data().country.get(country_code)
+    res = _data().country.get(country_code)
+    return None if res is None else list(res)
 
 
-def parse(v: str, country_code: Optional[str] = None) -> Optional[list[Currency]]:
+def parse(
+    v: Union[str, bytes, bytearray, memoryview, int],
+    country_code: Optional[str] = None,
+    locale: Optional[str] = None,
+) -> Optional[list[Currency]]:
     """Try parse `v` to currencies; filter by country_code
 
-    If `v` is a number, try `by_code_num()`; otherwise try:
+    If `v` is a number (or ASCII digits), try `by_code_num()`; otherwise try:
         1) if `v` is 3 character uppercase: `by_alpha3()`
         2) Exact symbol match: `by_symbol()`
         3) Exact country code match: `by_country()`
-        4) Fuzzy by symbol match heuristic: `by_symbol_match()`
+        4) Exact localized name match, if `locale` is given: `by_name()`
+        5) Fuzzy localized name match, if `locale` is given: `by_name_match()`
+        6) Fuzzy by symbol match heuristic: `by_symbol_match()`
 
     Parameters:
-        v: Union[unicode, int]           Either a iso4217 numeric code or some string
+        v: Union[unicode, bytes, int]    Either a iso4217 numeric code or some string;
+                                         bytes are decoded as utf-8, if necessary
         country_code: Optional[unicode]  Iso3166 alpha2 country code.
+        locale: Optional[unicode]        Locale of localized currency names, see `locales()`.
 
     Returns:
         List[Currency]: found Currency objects.
     """
+    if isinstance(v, memoryview):
+        v = v.tobytes()
+
+    if isinstance(v, (bytes, bytearray)):
+        # check alpha3 and numeric code without decoding
+        if len(v) == 3 and v.isalpha() and v.isupper():
+            res = _data().alpha3_bytes.get(bytes(v))
+            if res:
+                return [res]
+        elif v.isdigit():
+            res = by_code_num(v)
+            return [] if not res else [res]
+        v = v.decode("utf-8", errors="replace")
+
     if isinstance(v, int):
         res = by_code_num(v)
         return [] if not res else [res]
 
     if not isinstance(v, str):
         raise ValueError(
-            "`v` of incorrect type {}. Only accepts str, bytes, unicode and int."
+            "`v` of incorrect type {}. Only accepts str, bytes and int.".format(type(v))
         )
 
+    if v.isascii() and v.isdigit():
+        res = by_code_num(v)
+        return [] if not res else [res]
+
     # check alpha3
-    if re.match("^[A-Z]{3}$", v):
+    if _ALPHA3_PATTERN.match(v):
         res = by_alpha3(v)
         if res:
             return [res]
@@ -294,8 +1002,418 @@ def parse(v: str, country_code: Optional[str] = None) -> Optional[list[Currency]
     if ress:
         return ress
 
+    # check by localized name, exact and fuzzy; before the english symbols, as
+    # localized names often contain them (i.e. `Kanadische Dollar`)
+    if locale is not None:
+        ress = by_name(v, locale, country_code)
+        if ress:
+            return ress
+        ress = by_name_match(v, locale, country_code)
+        if ress:
+            return ress
+
     # more or less fuzzy match by symbol
     ress = by_symbol_match(v, country_code)
     if ress:
         return ress
     return None
+
+
+def best(
+    v: Union[str, bytes, bytearray, memoryview, int],
+    country_code: Optional[str] = None,
+) -> Optional[Currency]:
+    """Get the single most likely currency for `v`; filter by country_code
+
+    Rank the currencies of `parse()` by: at least one symbol, official (with
+    numeric code) before unofficial, then - with `country_code` - fewer countries
+    (more specific) first, or - without - more countries (more widely used) first.
+    Remaining ties keep the order of `parse()`. Exact symbols are answered from a
+    precomputed table; symbols with a country not using them are remembered
+    after the first call.
+
+    Parameters:
+        v: Union[unicode, bytes, int]    See `parse()`.
+        country_code: Optional[unicode]  Iso3166 alpha2 country code.
+
+    Returns:
+        Currency: best Currency object, if any was found.
+    """
+    if isinstance(v, str):
+        key = (v, country_code)
+        res = _best().get(key)
+        if res is not None:
+            return res
+        if key in _BEST_FALLBACK:
+            return _BEST_FALLBACK[key]
+    ress = parse(v, country_code)
+    with_country = country_code is not None
+    res = min(ress, key=lambda d: _best_rank(d, with_country)) if ress else None
+    if (
+        isinstance(v, str)
+        and v in _data().symbol
+        and len(_BEST_FALLBACK) < _BEST_FALLBACK_MAX
+    ):
+        # only symbols, not arbitrary text; racing threads store the same result
+        _BEST_FALLBACK[(v, country_code)] = res
+    return res
+
+
+def _country_column(country_codes, n: int) -> list[Optional[str]]:
+    if country_codes is None or isinstance(country_codes, str):
+        return [country_codes] * n
+    res = list(country_codes)
+    if len(res) != n:
+        raise ValueError("Got {} values but {} country codes.".format(n, len(res)))
+    return res
+
+
+def filter_many(
+    candidates: Iterable[Optional[list[Currency]]],
+    country_codes: Union[None, str, Iterable[Optional[str]]],
+) -> list[Optional[list[Currency]]]:
+    """Restrict each list of candidate currencies to those used in its country
+
+    Membership is tested against the precomputed currency x country bitmasks,
+    i.e. without scanning `Currency.countries`.
+
+    Parameters:
+        candidates: Iterable[Optional[List[Currency]]]  e.g. results of `parse_many()`.
+        country_codes: Union[None, unicode, Iterable]  Either one iso3166 alpha2
+            country code for all candidates, or one (optional) code per candidates.
+
+    Returns:
+        List[Optional[List[Currency]]]: filtered candidates; None if nothing is left.
+    """
+    candidates = list(candidates)
+    currency_id = _data().currency_id
+    country_mask = _data().country_mask
+    res: list[Optional[list[Currency]]] = []
+    for cs, cc in zip(candidates, _country_column(country_codes, len(candidates))):
+        if cs and cc is not None:
+            mask = country_mask.get(cc, 0)
+            cs = [d for d in cs if mask >> currency_id[d.alpha3] & 1]
+        res += [cs or None]
+    return res
+
+
+def parse_many(
+    values: Iterable,
+    country_codes: Union[None, str, Iterable[Optional[str]]] = None,
+) -> list[Optional[list[Currency]]]:
+    """Parse many values; see `parse()`
+
+    Every distinct pair of value and country code is parsed only once; every
+    row gets its own list. Country filtering is done by `parse()` itself (with
+    the currency x country bitmasks of `by_symbol()` and `by_symbol_match()`),
+    as the country changes which heuristic step matches.
+
+    Parameters:
+        values: Iterable[Union[unicode, int]]  Values to parse.
+        country_codes: Union[None, unicode, Iterable]  Either one iso3166 alpha2
+            country code for all values, or one (optional) code per value.
+
+    Returns:
+        List[Optional[List[Currency]]]: found Currency objects per value.
+    """
+    values = list(values)
+    seen: dict[tuple, Optional[list[Currency]]] = {}
+    res = []
+    for v, cc in zip(values, _country_column(country_codes, len(values))):
+        key = (type(v), v, cc)
+        try:
+            found = seen[key]
+        except KeyError:
+            found = seen[key] = parse(v, cc)
+        except TypeError:  # unhashable, `parse` raises a ValueError
+            found = parse(v, cc)
+        res += [None if found is None else list(found)]
+    return res
+
+
+def _currency_key(currency) -> Union[str, int]:
+    if isinstance(currency, Currency):
+        return currency.alpha3
+    if not isinstance(currency, (str, int)) and hasattr(currency, "item"):
+        # e.g. numpy scalars
+        currency = currency.item()
+    return currency
+
+
+def _currency_column(currencies, n: int) -> list[Union[str, int]]:
+    if isinstance(currencies, (str, int, Currency)) or not isinstance(
+        currencies, Iterable
+    ):
+        return [_currency_key(currencies)] * n
+    res = [_currency_key(c) for c in currencies]
+    if len(res) != n:
+        raise ValueError("Got {} amounts but {} currencies.".format(n, len(res)))
+    return res
+
+
+def _minor_lookup(currencies, n: int) -> list[tuple[int, int]]:
+    table = _minor()
+    res = []
+    for c in _currency_column(currencies, n):
+        try:
+            res += [table[c]]
+        except (KeyError, TypeError):
+            raise ValueError("Unknown currency {!r}.".format(c)) from None
+    return res
+
+
+def to_minor_units(
+    amounts: Iterable, currencies: Union[str, int, Currency, Iterable]
+) -> list[int]:
+    """Convert amounts to integer minor units (cents, fils, ...)
+
+    Scale every amount by `10 ** Currency.minor` of its currency and round half
+    to even. Integers are scaled exactly, `Decimal` amounts are rounded exactly
+    and floats are taken by their shortest representation (i.e. `1.005` is
+    `Decimal("1.005")`, not the binary approximation).
+
+    Parameters:
+        amounts: Iterable[Union[int, float, Decimal]]  Amounts in major units,
+            e.g. a list or a numpy array.
+        currencies: Union[unicode, int, Currency, Iterable]  Either one currency
+            for all amounts, or one currency (alpha3, code_num or Currency) per amount.
+
+    Returns:
+        List[int]: Amounts in minor units.
+
+    Raises:
+        ValueError: for unknown currencies, amounts of other types (i.e. str or bool;
+            nothing is coerced) or if lengths do not match.
+        OverflowError: if a result does not fit into a signed 64 bit integer.
+    """
+    amounts = list(amounts)
+    res = []
+    for a, (minor, factor) in zip(amounts, _minor_lookup(currencies, len(amounts))):
+        if hasattr(a, "item"):
+            # e.g. numpy scalars
+            a = a.item()
+        if isinstance(a, bool) or not isinstance(a, (int, float, Decimal)):
+            raise ValueError(
+                "Amounts have to be int, float or Decimal, got {!r}.".format(a)
+            )
+        if isinstance(a, int):
+            v = a * factor
+        elif isinstance(a, Decimal):
+            v = round(a.scaleb(minor))
+        else:
+            x = a * factor
+            # far enough from a rounding tie, the binary error of `a * factor`
+            # cannot change the result; otherwise go the exact (slow) way
+            if abs(x) < _FLOAT_EXACT_MAX and abs(x - floor(x) - 0.5) > 1e-3:
+                v = round(x)
+            else:
+                v = round(Decimal(repr(a)).scaleb(minor))
+        if not -_MINOR_UNITS_MAX - 1 <= v <= _MINOR_UNITS_MAX:
+            raise OverflowError("{!r} does not fit into 64 bit minor units.".format(a))
+        res += [v]
+    return res
+
+
+def from_minor_units(
+    units: Iterable, currencies: Union[str, int, Currency, Iterable]
+) -> list[Decimal]:
+    """Convert integer minor units back to (exact) amounts in major units
+
+    Parameters:
+        units: Iterable[int]  Amounts in minor units, e.g. a list or a numpy array.
+        currencies: Union[unicode, int, Currency, Iterable]  Either one currency
+            for all amounts, or one currency (alpha3, code_num or Currency) per amount.
+
+    Returns:
+        List[Decimal]: Amounts in major units with `Currency.minor` decimal digits.
+
+    Raises:
+        ValueError: for unknown currencies, non-integral units or if lengths do not match.
+        OverflowError: if a value does not fit into a signed 64 bit integer.
+    """
+    units = list(units)
+    res = []
+    for u, (minor, _) in zip(units, _minor_lookup(currencies, len(units))):
+        if hasattr(u, "item"):
+            u = u.item()
+        if isinstance(u, bool) or not isinstance(u, int):
+            raise ValueError("Minor units have to be integers, got {!r}.".format(u))
+        if not -_MINOR_UNITS_MAX - 1 <= u <= _MINOR_UNITS_MAX:
+            raise OverflowError("{!r} does not fit into 64 bit minor units.".format(u))
+        res += [Decimal(u).scaleb(-minor)]
+    return res
+
+
+_FORMAT_STYLES = ("symbol", "code", "plain")
+_FORMATTERS: dict[tuple[Union[str, int], str, str, str], Callable[[object], str]] = {}
+_FORMATTERS_MAX = 1024
+
+
+def _formatter(
+    currency: Any, style: str, thousands_sep: str, decimal_sep: str
+) -> Callable[[object], str]:
+    if type(currency) is not str and type(currency) is not int:
+        # i.e. Currency or numpy scalars; plain values are the key as they are
+        currency = _currency_key(currency)
+        if isinstance(currency, bool) or not isinstance(currency, (str, int)):
+            # not to hit the entry of an equal value, i.e. `978.0`
+            raise ValueError("Unknown currency {!r}.".format(currency))
+        currency = str(currency) if isinstance(currency, str) else int(currency)
+    key = (currency, style, thousands_sep, decimal_sep)
+    fmt = _FORMATTERS.get(key)
+    if fmt is None:
+        fmt = _build_formatter(*key)
+        if len(_FORMATTERS) < _FORMATTERS_MAX:
+            # racing threads at most store equivalent formatters
+            _FORMATTERS[key] = fmt
+    return fmt
+
+
+def _build_formatter(
+    currency: Union[str, int], style: str, thousands_sep: str, decimal_sep: str
+) -> Callable[[object], str]:
+    if style not in _FORMAT_STYLES:
+        raise ValueError(
+            "Unknown style {!r}, use one of {}.".format(style, _FORMAT_STYLES)
+        )
+    d = None
+    if isinstance(currency, str):
+        d = _data().alpha3.get(currency)
+    elif isinstance(currency, int):
+        d = _data().code_num.get(currency)
+    if d is None:
+        raise ValueError("Unknown currency {!r}.".format(currency))
+
+    prefix, suffix = "", ""
+    if style == "symbol" and d.symbols:
+        prefix = d.symbols[0]
+    elif style != "plain":
+        suffix = " " + d.alpha3
+
+    spec = ",.{}f".format(d.minor)
+    quantum = Decimal(1).scaleb(-d.minor)
+    factor = 10**d.minor
+    separators = str.maketrans({",": thousands_sep, ".": decimal_sep})
+    translate = (thousands_sep, decimal_sep) != (",", ".")
+    zeros = "-0" + thousands_sep + decimal_sep
+    zero = prefix + format(0, spec).translate(separators) + suffix
+    # the fast float path only uses closure variables: global lookups would
+    # cost more than the rounding check itself
+    exact_max, floor_, format_ = _FLOAT_EXACT_MAX, floor, format
+    tie_lo, tie_hi = 0.5 - 1e-3, 0.5 + 1e-3
+
+    def fmt(amount: Any) -> str:
+        if type(amount) is float:
+            # round like `to_minor_units()`: the shortest representation; far
+            # enough from a rounding tie, `format()` of the binary value is the same
+            x = amount * factor
+            if -exact_max < x < exact_max and not tie_lo < x - floor_(x) < tie_hi:
+                if -0.5 <= x <= 0.5:
+                    return zero  # no `-0.00`
+                res = format_(amount if x > 0 else -amount, spec)
+                if translate:
+                    res = res.translate(separators)
+                return (prefix if x > 0 else "-" + prefix) + res + suffix
+            amount = Decimal(repr(amount)).quantize(quantum, rounding=ROUND_HALF_EVEN)
+        elif type(amount) is not int:
+            if not isinstance(amount, Decimal) and hasattr(amount, "item"):
+                # e.g. numpy scalars
+                return fmt(amount.item())
+            if isinstance(amount, Decimal):
+                amount = amount.quantize(quantum, rounding=ROUND_HALF_EVEN)
+        res = format(amount, spec)
+        if translate:
+            res = res.translate(separators)
+        if res[0] == "-":
+            if not res.strip(zeros):
+                return prefix + res[1:] + suffix  # no `-0.00`
+            return "-" + prefix + res[1:] + suffix
+        return prefix + res + suffix
+
+    return fmt
+
+
+def format_amount(
+    amount: object,
+    currency: Union[str, int, Currency],
+    style: str = "symbol",
+    thousands_sep: str = ",",
+    decimal_sep: str = ".",
+) -> str:
+    """Format `amount` in `currency` with `Currency.minor` decimal digits
+
+    Amounts are rounded half to even like in `to_minor_units()`, i.e. floats by
+    their shortest representation (`2.675` is `2.68` in EUR).
+
+    Styles:
+        symbol: `Currency.symbols[0]` in front of the amount, i.e. `€1,234.50`.
+                Falls back to `code` for currencies without symbols.
+        code:   alpha3 code after the amount, i.e. `1,234.50 EUR`.
+        plain:  only the amount, i.e. `1,234.50`.
+
+    The formatter for each combination of currency, style and separators is
+    built once and cached.
+
+    Parameters:
+        amount: Union[int, float, Decimal]  Amount in major units.
+        currency: Union[unicode, int, Currency]  Alpha3 code, numeric code or Currency.
+        style: unicode          One of `symbol`, `code` or `plain`.
+        thousands_sep: unicode  Separator for groups of thousands.
+        decimal_sep: unicode    Separator for the decimal digits.
+
+    Returns:
+        unicode: formatted amount.
+
+    Raises:
+        ValueError: for unknown currencies or styles.
+    """
+    return _formatter(currency, style, thousands_sep, decimal_sep)(amount)
+
+
+def format_many(
+    amounts: Iterable,
+    currencies: Union[str, int, Currency, Iterable],
+    style: str = "symbol",
+    thousands_sep: str = ",",
+    decimal_sep: str = ".",
+) -> list[str]:
+    """Format many amounts; see `format_amount()`
+
+    Parameters:
+        amounts: Iterable[Union[int, float, Decimal]]  Amounts in major units.
+        currencies: Union[unicode, int, Currency, Iterable]  Either one currency
+            for all amounts, or one currency (alpha3, code_num or Currency) per amount.
+        style: unicode          One of `symbol`, `code` or `plain`.
+        thousands_sep: unicode  Separator for groups of thousands.
+        decimal_sep: unicode    Separator for the decimal digits.
+
+    Returns:
+        List[unicode]: formatted amounts.
+
+    Raises:
+        ValueError: for unknown currencies, styles or if lengths do not match.
+    """
+    amounts = list(amounts)
+    if isinstance(currencies, (str, int, Currency)) or not isinstance(
+        currencies, Iterable
+    ):
+        single = _formatter(currencies, style, thousands_sep, decimal_sep)
+        return [single(a) for a in amounts]
+
+    currencies = list(currencies)
+    if len(currencies) != len(amounts):
+        raise ValueError(
+            "Got {} amounts but {} currencies.".format(len(amounts), len(currencies))
+        )
+    # by the raw cell, such that most rows are a single dict lookup
+    formatters: dict[Union[str, int], Callable[[object], str]] = {}
+    res: list[str] = []
+    append = res.append
+    for a, c in zip(amounts, currencies):
+        fmt = formatters.get(c) if type(c) is str or type(c) is int else None
+        if fmt is None:
+            fmt = _formatter(c, style, thousands_sep, decimal_sep)
+            if type(c) is str or type(c) is int:
+                formatters[c] = fmt
+        append(fmt(a))
+    return res
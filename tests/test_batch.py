@@ -0,0 +1,58 @@
+import pytest
+
+import iso4217parse
+
+
+def test_masks():
+    data = iso4217parse._data()
+    assert len(data.currencies) == len(data.alpha3)
+    for s, currencies in data.symbol.items():
+        assert list(currencies) == iso4217parse._from_mask(data.symbol_mask[s])
+    for cc, currencies in data.country.items():
+        assert sorted(d.alpha3 for d in currencies) == sorted(
+            d.alpha3 for d in iso4217parse._from_mask(data.country_mask[cc])
+        )
+
+
+def test_parse_many():
+    values = ["CHF", 51, "Price is 5 €", "$", "$", "HK", "Blaa"]
+    assert [iso4217parse.parse(v) for v in values] == iso4217parse.parse_many(values)
+
+
+def test_parse_many_country_codes():
+    usd = iso4217parse.by_alpha3("USD")
+    cad = iso4217parse.by_alpha3("CAD")
+    assert [[usd], [usd], [cad]] == iso4217parse.parse_many(
+        ["$", "$", "$"], ["US", "US", "CA"]
+    )
+    assert [[usd], [usd]] == iso4217parse.parse_many(["$", "＄"], "US")
+    with pytest.raises(ValueError):
+        iso4217parse.parse_many(["$", "$"], ["US"])
+
+
+def test_parse_many_copies():
+    res = iso4217parse.parse_many(["$", "$"])
+    assert res[0] is not res[1]
+    res[0].clear()
+    assert res[1] == iso4217parse.by_symbol("$")
+    assert res[1] == iso4217parse.parse_many(["$"])[0]
+
+
+def test_parse_many_invalid():
+    with pytest.raises(ValueError):
+        iso4217parse.parse_many([[]])
+
+
+def test_filter_many():
+    dollars = iso4217parse.by_symbol("$")
+    eur = iso4217parse.by_alpha3("EUR")
+    assert [
+        [iso4217parse.by_alpha3("USD")],
+        None,
+        dollars,
+        None,
+        [eur],
+    ] == iso4217parse.filter_many(
+        [dollars, dollars, dollars, None, [eur]], ["US", "DE", None, "US", "DE"]
+    )
+    assert [None, [eur]] == iso4217parse.filter_many([dollars, [eur]], "DE")
@@ -0,0 +1,63 @@
+import pytest
+
+import iso4217parse
+
+
+def test_invalid():
+    assert iso4217parse.best("Blaa") is None
+    assert iso4217parse.best("$", "DOESNT_EXIST") is None
+    assert iso4217parse.best(1) is None
+    with pytest.raises(ValueError):
+        iso4217parse.best([])
+
+
+@pytest.mark.parametrize(
+    "value, country_code, expected",
+    (
+        ("$", None, "USD"),
+        ("£", None, "GBP"),
+        ("€", None, "EUR"),
+        ("元", None, "CNY"),
+        ("$", "US", "USD"),
+        ("$", "HK", "HKD"),
+        ("元", "HK", "HKD"),
+        ("元", "CN", "CNY"),
+        ("£", "GB", "GBP"),
+        ("kr", "SE", "SEK"),
+        ("CHF", None, "CHF"),
+        (978, None, "EUR"),
+        (b"EUR", None, "EUR"),
+        ("Price is 5 €", None, "EUR"),
+        ("The price is ₨ 35.8 !", "NP", "NPR"),
+    ),
+)
+def test_examples(value, country_code, expected):
+    assert iso4217parse.by_alpha3(expected) == iso4217parse.best(value, country_code)
+
+
+def test_same_as_ranked_parse():
+    for symbol in iso4217parse._data().symbol:
+        for country_code in (None, "US", "CN", "DE", "HK", "ZZ"):
+            found = iso4217parse.parse(symbol, country_code)
+            expected = (
+                min(
+                    found,
+                    key=lambda d: iso4217parse._best_rank(d, country_code is not None),
+                )
+                if found
+                else None
+            )
+            assert expected == iso4217parse.best(symbol, country_code)
+
+
+@pytest.mark.parametrize(
+    "value, country_code, expected",
+    (("$", "DE", None), ("US$", "AU", "AUD"), ("€", "US", None)),
+)
+def test_symbol_not_used_in_country(value, country_code, expected):
+    iso4217parse._BEST_FALLBACK.pop((value, country_code), None)
+    assert (value, country_code) not in iso4217parse._best()
+    expected = iso4217parse.by_alpha3(expected) if expected else None
+    assert expected == iso4217parse.best(value, country_code)
+    assert (value, country_code) in iso4217parse._BEST_FALLBACK
+    assert expected == iso4217parse.best(value, country_code)
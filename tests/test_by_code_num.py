@@ -5,6 +5,11 @@ def test_invalid():
     assert iso4217parse.by_code_num(None) is None
     assert iso4217parse.by_code_num(1234) is None
     assert iso4217parse.by_code_num("Blaa") is None
+    assert iso4217parse.by_code_num(-51) is None
+    assert iso4217parse.by_code_num("") is None
+    assert iso4217parse.by_code_num("0051") is None
+    assert iso4217parse.by_code_num("５１") is None  # not ASCII
+    assert iso4217parse.by_code_num(b"5a") is None
 
 
 def test_all_currencies():
@@ -22,3 +27,9 @@ def test_examples():
         countries=["AM"],
     )
     assert exp == iso4217parse.by_code_num(51)
+
+
+def test_strings_and_bytes():
+    exp = iso4217parse.by_code_num(51)
+    for code in ("51", "051", b"51", b"051", bytearray(b"051"), memoryview(b"051")):
+        assert exp == iso4217parse.by_code_num(code)
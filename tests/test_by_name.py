@@ -0,0 +1,109 @@
+import importlib.resources
+import json
+
+import pytest
+
+import iso4217parse
+
+
+def test_locales():
+    assert {"de", "es", "fr"} <= set(iso4217parse.locales())
+    with pytest.raises(ValueError):
+        iso4217parse.by_name("Euro", "xx")
+    with pytest.raises(ValueError):
+        iso4217parse.by_name("Euro", "../data")
+
+
+def test_lazy():
+    iso4217parse._NAMES.pop("sv", None)
+    iso4217parse.parse("Schweizer Franken")
+    assert "sv" not in iso4217parse._NAMES
+    iso4217parse.by_name("euro", "sv")
+    assert "sv" in iso4217parse._NAMES
+
+
+@pytest.mark.parametrize(
+    "name, locale, expected",
+    (
+        ("Schweizer Franken", "de", "CHF"),
+        ("schweizer franken", "de_CH", "CHF"),
+        ("dólar estadounidense", "es", "USD"),
+        ("dólares estadounidenses", "es-MX", "USD"),
+        ("francs suisses", "fr", "CHF"),
+        ("швейцарских франков", "ru", "CHF"),
+        ("TÜRK LIRASI", "tr", "TRY"),
+        ("türk lirasi", "tr", "TRY"),
+    ),
+)
+def test_by_name(name, locale, expected):
+    assert [iso4217parse.by_alpha3(expected)] == iso4217parse.by_name(name, locale)
+
+
+def test_by_name_country_code():
+    eur = iso4217parse.by_alpha3("EUR")
+    assert [eur] == iso4217parse.by_name("Euro", "de", "DE")
+    assert iso4217parse.by_name("Euro", "de", "US") is None
+    assert iso4217parse.by_name("Blaa", "de") is None
+
+
+@pytest.mark.parametrize(
+    "value, locale, expected",
+    (
+        ("Preis: 5 Schweizer Franken", "de", "CHF"),
+        ("cuesta 5 dólares estadounidenses", "es", "USD"),
+        ("价格100美元", "zh", "USD"),
+        ("fiyat 5 TÜRK LIRASI", "tr", "TRY"),
+    ),
+)
+def test_by_name_match(value, locale, expected):
+    assert [iso4217parse.by_alpha3(expected)] == iso4217parse.by_name_match(
+        value, locale
+    )
+
+
+def test_by_name_match_all_names():
+    names = importlib.resources.files("iso4217parse").joinpath("names")
+    for locale in iso4217parse.locales():
+        with names.joinpath(locale + ".json").open(encoding="utf-8") as f:
+            localized = json.load(f)
+        for code, ns in localized.items():
+            curr = iso4217parse.by_alpha3(code)
+            for n in ns:
+                for form in (n, n.upper(), n.lower()):
+                    res = iso4217parse.by_name_match("10 " + form, locale)
+                    assert res is not None and curr in res, (locale, form)
+
+
+@pytest.mark.parametrize(
+    "value, locale, expected",
+    (("10 Weißrussischer Rubel", "de", "BYN"), ("i̇sviçre frangı", "tr", "CHF")),
+)
+def test_by_name_match_folded(value, locale, expected):
+    assert iso4217parse.by_alpha3(expected) in iso4217parse.by_name_match(value, locale)
+
+
+def test_locale_aliases():
+    assert iso4217parse._names("de") is iso4217parse._names("de_CH")
+    assert iso4217parse._names("de") is iso4217parse._names("de-AT")
+    assert "de_CH" not in iso4217parse._NAMES
+
+
+def test_by_name_match_word_boundaries():
+    assert iso4217parse.by_name_match("Schweizer Frankenstein", "de") is None
+
+
+def test_parse_locale():
+    usd = iso4217parse.by_alpha3("USD")
+    assert [usd] == iso4217parse.parse("dólar estadounidense", locale="es")
+    assert [usd] == iso4217parse.parse("12 долларов США", locale="ru")
+    assert iso4217parse.parse("долларов США") is None
+
+
+@pytest.mark.parametrize(
+    "value, locale",
+    (("10 Kanadische Dollar", "de"), ("10 dollars canadiens", "fr")),
+)
+def test_parse_locale_before_symbols(value, locale):
+    cad = iso4217parse.by_alpha3("CAD")
+    assert [cad] == iso4217parse.parse(value, locale=locale)
+    assert len(iso4217parse.parse(value)) > 1
@@ -0,0 +1,95 @@
+from decimal import Decimal
+
+import pytest
+
+import iso4217parse
+
+
+def test_format_amount_styles():
+    assert "€1,234.50" == iso4217parse.format_amount(1234.5, "EUR")
+    assert "1,234.50 EUR" == iso4217parse.format_amount(1234.5, "EUR", "code")
+    assert "1,234.50" == iso4217parse.format_amount(1234.5, "EUR", "plain")
+    assert "-US$3.00" == iso4217parse.format_amount(-3, 840)
+    assert "-3.00 USD" == iso4217parse.format_amount(-3, 840, style="code")
+
+
+def test_format_amount_minor():
+    assert "JP¥1,235" == iso4217parse.format_amount(1234.6, "JPY")
+    assert "1.235 KWD" == iso4217parse.format_amount(
+        Decimal("1.2346"), "KWD", style="code"
+    )
+
+
+def test_format_amount_rounding():
+    amounts = [2.675, 1.005, 1.015, -1.5, Decimal("0.125")]
+    units = iso4217parse.to_minor_units(amounts, "EUR")
+    assert [
+        "€{:.2f}".format(u / 100).replace("€-", "-€") for u in units
+    ] == iso4217parse.format_many(amounts, "EUR")
+    assert "€2.68" == iso4217parse.format_amount(2.675, "EUR")
+    assert "JP¥2" == iso4217parse.format_amount(2.5, "JPY")
+
+
+def test_format_amount_negative_zero():
+    assert "€0.00" == iso4217parse.format_amount(-0.001, "EUR")
+    assert "€0.00" == iso4217parse.format_amount(Decimal("-0.001"), "EUR")
+    assert "0 JPY" == iso4217parse.format_amount(-0.4, "JPY", "code")
+    assert "-€0.01" == iso4217parse.format_amount(-0.006, "EUR")
+
+
+def test_format_amount_separators():
+    chf = iso4217parse.by_alpha3("CHF")
+    assert "SFr.1'234.50" == iso4217parse.format_amount(1234.5, chf, thousands_sep="'")
+    assert "1.234.567,89 EUR" == iso4217parse.format_amount(
+        1234567.891, "EUR", "code", thousands_sep=".", decimal_sep=","
+    )
+
+
+def test_format_amount_without_symbol():
+    curr = next(c for c in iso4217parse._data().alpha3.values() if not c.symbols)
+    assert iso4217parse.format_amount(1, curr, "code") == iso4217parse.format_amount(
+        1, curr
+    )
+
+
+@pytest.mark.parametrize(
+    "currency, style",
+    (("XXY", "symbol"), (1234, "symbol"), (None, "symbol"), ("EUR", "fancy")),
+)
+def test_format_invalid(currency, style):
+    with pytest.raises(ValueError):
+        iso4217parse.format_amount(1, currency, style)
+    with pytest.raises(ValueError):
+        iso4217parse.format_many([1], [currency], style)
+
+
+def test_format_many():
+    assert ["1.00 EUR", "2 JPY", "2.500 KWD", "3.00 EUR"] == iso4217parse.format_many(
+        [1, 2, 2.5, 3], ["EUR", 392, "KWD", "EUR"], style="code"
+    )
+    assert ["1,00", "2,50"] == iso4217parse.format_many(
+        [1, 2.5], "EUR", style="plain", decimal_sep=","
+    )
+    with pytest.raises(ValueError):
+        iso4217parse.format_many([1, 2], ["EUR"])
+
+
+class Scalar:
+    # like numpy.float64 / numpy.int64
+    def __init__(self, value):
+        self.value = value
+
+    def item(self):
+        return self.value
+
+
+def test_format_many_cells():
+    assert ["€1.50", "-€2.00", "€3.00"] == iso4217parse.format_many(
+        [Scalar(1.5), Scalar(-2), 3], [978, Scalar(978), iso4217parse.by_alpha3("EUR")]
+    )
+    assert ["-1.234,50 EUR"] == iso4217parse.format_many(
+        [-1234.5], ["EUR"], "code", thousands_sep=".", decimal_sep=","
+    )
+    # equal, but not a currency
+    with pytest.raises(ValueError):
+        iso4217parse.format_many([1, 2], [978, 978.0])
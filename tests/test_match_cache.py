@@ -0,0 +1,127 @@
+import sqlite3
+
+import pytest
+
+import iso4217parse
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    path = tmp_path / "matches.sqlite"
+    iso4217parse.set_match_cache(path)
+    yield path
+    iso4217parse.set_match_cache(None)
+
+
+def test_disabled():
+    assert iso4217parse.match_cache_stats() is None
+
+
+def test_hits(cache_path):
+    values = ["The price is ₨ 35.8 !", "  The price is ₨ 35.8 !", "no currency"]
+    expected = [iso4217parse._by_symbol_match(v, "NP") for v in values]
+    assert expected == [iso4217parse.by_symbol_match(v, "NP") for v in values]
+    assert expected == [iso4217parse.by_symbol_match(v, "NP") for v in values]
+
+    stats = iso4217parse.match_cache_stats()
+    assert stats is not None
+    assert (4, 2, 0) == (stats.hits, stats.misses, stats.errors)
+    assert 4 / 6 == stats.hit_rate
+    assert stats.mean_lookup_seconds > 0
+
+
+def test_amounts(cache_path):
+    eua17 = "European Unit of Account 17 (E.U.A.-17) (bond market unit)"
+    values = [
+        "RD$35.8",
+        "RD$ 1,000.00",
+        "RD$12",
+        "RD$ 1 000,00",
+        "12 RD$",
+        "E.U.A.-17",
+        "5 " + eua17,
+        "5 " + eua17.replace("17", "9"),
+    ]
+    expected = [iso4217parse._by_symbol_match(v) for v in values]
+    assert expected == [iso4217parse.by_symbol_match(v) for v in values]
+
+    with sqlite3.connect(cache_path) as con:
+        rows = con.execute("SELECT value FROM matches ORDER BY rowid").fetchall()
+    con.close()
+    # symbols with digits are kept
+    assert [
+        ("RD$0",),
+        ("RD$ 0",),
+        ("0 RD$",),
+        ("E.U.A.-0",),
+        ("5 " + eua17,),
+        ("5 " + eua17.replace("17", "9"),),
+    ] == rows
+    stats = iso4217parse.match_cache_stats()
+    assert stats is not None
+    assert (2, 6) == (stats.hits, stats.misses)
+
+
+def test_max_rows(tmp_path):
+    iso4217parse.set_match_cache(tmp_path / "matches.sqlite", max_rows=3)
+    try:
+        for v in ["RD$", "€", "£", "¥", "₨"]:
+            iso4217parse.by_symbol_match(v)
+        with sqlite3.connect(tmp_path / "matches.sqlite") as con:
+            rows = con.execute("SELECT value FROM matches ORDER BY rowid").fetchall()
+        con.close()
+        assert [("£",), ("¥",), ("₨",)] == rows
+
+        with pytest.raises(ValueError):
+            iso4217parse.set_match_cache(tmp_path / "other.sqlite", max_rows=0)
+    finally:
+        iso4217parse.set_match_cache(None)
+
+
+def test_errors(cache_path):
+    cache = iso4217parse._MATCH_CACHE
+    assert cache is not None
+    # i.e. closed by `set_match_cache()` in another thread
+    cache.close()
+    assert [iso4217parse.by_alpha3("DOP")] == iso4217parse.parse("RD$35.8")
+    assert 1 == cache.stats.errors
+
+
+def test_locked(cache_path):
+    cache = iso4217parse._MATCH_CACHE
+    assert cache is not None
+    cache._con.execute("PRAGMA busy_timeout = 0")
+
+    con = sqlite3.connect(cache_path)
+    con.execute("BEGIN EXCLUSIVE")
+    try:
+        assert [iso4217parse.by_alpha3("DOP")] == iso4217parse.parse("RD$35.8")
+    finally:
+        con.rollback()
+        con.close()
+    assert cache.stats.errors >= 1
+
+
+def test_persistent(cache_path):
+    assert [iso4217parse.by_alpha3("DOP")] == iso4217parse.parse("RD$35.8")
+
+    iso4217parse.set_match_cache(cache_path)
+    assert [iso4217parse.by_alpha3("DOP")] == iso4217parse.parse("RD$35.8")
+    stats = iso4217parse.match_cache_stats()
+    assert stats is not None
+    assert (1, 0) == (stats.hits, stats.misses)
+
+
+def test_invalidated(cache_path):
+    iso4217parse.by_symbol_match("RD$35.8")
+    iso4217parse.set_match_cache(None)
+
+    with sqlite3.connect(cache_path) as con:
+        assert 1 == con.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+        con.execute("UPDATE meta SET value = 'outdated' WHERE key = 'version'")
+    con.close()
+
+    iso4217parse.set_match_cache(cache_path)
+    with sqlite3.connect(cache_path) as con:
+        assert 0 == con.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+    con.close()
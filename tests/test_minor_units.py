@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pytest
+
+import iso4217parse
+
+
+def test_to_minor_units():
+    assert [1050, 1050, 1050, 7] == iso4217parse.to_minor_units(
+        [10.5, Decimal("10.50"), Decimal("10.5"), 7], ["EUR", "USD", 840, "JPY"]
+    )
+    assert [1234, 10, 1236] == iso4217parse.to_minor_units(
+        [1.234, 0.01, Decimal("1.2355")], "KWD"
+    )
+
+
+def test_to_minor_units_rounding():
+    # floats are taken by their shortest representation
+    assert [268, 101, 100] == iso4217parse.to_minor_units(
+        [2.675, 1.0051, 1.004999], "EUR"
+    )
+    # round half to even
+    assert [0, 2, 2, -2] == iso4217parse.to_minor_units([0.5, 1.5, 2.5, -1.5], "JPY")
+
+
+def test_to_minor_units_currency_objects():
+    eur = iso4217parse.by_alpha3("EUR")
+    assert [1999] == iso4217parse.to_minor_units([19.99], eur)
+    assert [1999] == iso4217parse.to_minor_units([19.99], [eur])
+
+
+def test_from_minor_units():
+    res = iso4217parse.from_minor_units([1050, 7, 1234], ["EUR", "JPY", 414])
+    assert [Decimal("10.50"), Decimal("7"), Decimal("1.234")] == res
+    assert ["10.50", "7", "1.234"] == [str(r) for r in res]
+
+
+def test_roundtrip():
+    amounts = [Decimal("-12.34"), Decimal("0.00"), Decimal("99999.99")]
+    units = iso4217parse.to_minor_units(amounts, "CHF")
+    assert amounts == iso4217parse.from_minor_units(units, "CHF")
+
+
+@pytest.mark.parametrize("currencies", ("XXY", 1234, None, ["EUR", "EUR"], []))
+def test_invalid_currencies(currencies):
+    with pytest.raises(ValueError):
+        iso4217parse.to_minor_units([1], currencies)
+    with pytest.raises(ValueError):
+        iso4217parse.from_minor_units([1], currencies)
+
+
+@pytest.mark.parametrize("amount", ("1.5", b"1", True, None, [1], 1 + 2j))
+def test_invalid_amounts(amount):
+    with pytest.raises(ValueError):
+        iso4217parse.to_minor_units([amount], "EUR")
+
+
+@pytest.mark.parametrize("units", (1.5, "150", True, None, Decimal(150)))
+def test_invalid_units(units):
+    with pytest.raises(ValueError):
+        iso4217parse.from_minor_units([units], "EUR")
+
+
+def test_overflow():
+    with pytest.raises(OverflowError):
+        iso4217parse.to_minor_units([2**62], "EUR")
+    with pytest.raises(OverflowError):
+        iso4217parse.to_minor_units([1e17], "EUR")
+    with pytest.raises(OverflowError):
+        iso4217parse.from_minor_units([2**63], "EUR")
+    assert [2**63 - 1] == iso4217parse.to_minor_units([2**63 - 1], "JPY")
@@ -23,6 +23,23 @@ def test_examples_numbers():
             assert [exp] == iso4217.parse(num)
 
 
+def test_examples_numeric_strings():
+    for num, exp in iso4217._data().code_num.items():
+        assert [exp] == iso4217.parse(str(num))
+        assert [exp] == iso4217.parse("{:03}".format(num))
+        assert [exp] == iso4217.parse("{:03}".format(num).encode())
+    assert [] == iso4217.parse("001")
+    assert [] == iso4217.parse(b"1")
+
+
+def test_examples_bytes():
+    for code, exp in iso4217._data().alpha3.items():
+        assert [exp] == iso4217.parse(code.encode())
+        assert [exp] == iso4217.parse(memoryview(code.encode()))
+    assert [iso4217.by_alpha3("EUR")] == iso4217.parse("Price is 5 €".encode())
+    assert [iso4217.by_alpha3("CHF")] == iso4217.parse(bytearray(b"chf"))
+
+
 def test_examples_EUR():
     exp = iso4217.Currency(
         alpha3="EUR",
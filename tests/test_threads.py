@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import pickle
+import threading
+
+import pytest
+
+import iso4217parse
+
+VALUES = ["CHF", 51, b"EUR", "$", "HK", "Price is 5 €", "RD$35.8", "Blaa"]
+
+
+@pytest.fixture
+def unloaded(monkeypatch):
+    for table in ("_DATA", "_SYMBOLS", "_BEST", "_MINOR"):
+        monkeypatch.setattr(iso4217parse, table, None)
+    monkeypatch.setattr(iso4217parse, "_NAMES", {})
+
+
+def test_preload(unloaded):
+    iso4217parse.preload(["de"])
+    assert iso4217parse._DATA is not None
+    assert iso4217parse._SYMBOLS is not None
+    assert iso4217parse._BEST is not None
+    assert iso4217parse._MINOR is not None
+    assert ["de"] == list(iso4217parse._NAMES)
+
+
+def test_concurrent_first_use(unloaded):
+    threads = 16
+    barrier = threading.Barrier(threads)
+
+    def work(_):
+        barrier.wait()
+        return (
+            iso4217parse._data(),
+            iso4217parse._names("de"),
+            [iso4217parse.parse(v, locale="de") for v in VALUES],
+            [iso4217parse.best(v) for v in VALUES],
+            iso4217parse.format_many([1.5] * 3, ["EUR", "JPY", "KWD"]),
+        )
+
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(work, range(threads)))
+
+    data, names = results[0][:2]
+    for res in results:
+        # tables are built exactly once
+        assert res[0] is data
+        assert res[1] is names
+        assert res[2:] == results[0][2:]
+
+
+def test_immutable_tables():
+    data = iso4217parse._data()
+    with pytest.raises(AttributeError):
+        data.alpha3 = {}  # type: ignore[misc]
+    assert isinstance(data.code_num_table, tuple)
+    assert iso4217parse.by_symbol("Blaa") is None
+    assert "Blaa" not in data.symbol
+
+
+@pytest.mark.parametrize(
+    "lookup",
+    (
+        lambda: iso4217parse.by_symbol("$"),
+        lambda: iso4217parse.by_country("HK"),
+        lambda: iso4217parse.parse("$"),
+        lambda: iso4217parse.parse("HK"),
+        lambda: iso4217parse.by_name("Euro", "de"),
+        lambda: iso4217parse.by_name_match("5 Euro", "de"),
+    ),
+)
+def test_results_are_copies(lookup):
+    expected = list(lookup())
+    res = lookup()
+    res.append(None)
+    res.reverse()
+    assert expected == lookup()
+
+
+def test_currency_lists_read_only():
+    eur = iso4217parse.by_alpha3("EUR")
+    for values in (eur.symbols, eur.countries):
+        with pytest.raises(TypeError):
+            values.append("X")
+        with pytest.raises(TypeError):
+            values[0] = "X"
+        with pytest.raises(TypeError):
+            values += ["X"]
+    assert ["€", "euro", "euros"] == eur.symbols
+    assert "['€', 'euro', 'euros']" == repr(eur.symbols)
+    assert eur == pickle.loads(pickle.dumps(eur))
+    assert eur == copy.deepcopy(eur)
@@ -0,0 +1,107 @@
+import pytest
+
+import iso4217parse
+
+
+def test_is_alpha3():
+    for code in iso4217parse._data().alpha3:
+        assert iso4217parse.is_alpha3(code)
+    for v in ("eur", " EUR", b"EUR", "XXY", None, [], 978):
+        assert not iso4217parse.is_alpha3(v)
+    for v in ("eur", " EUR ", b"EUR", memoryview(b"eur")):
+        assert iso4217parse.is_alpha3(v, strict=False)
+    for v in ("XXY", None, [], 978, "EURO"):
+        assert not iso4217parse.is_alpha3(v, strict=False)
+
+
+def test_is_code_num():
+    for code in iso4217parse._data().code_num:
+        assert iso4217parse.is_code_num(code)
+    for v in ("978", b"978", True, 1, 1234, -1, None, [], 978.0):
+        assert not iso4217parse.is_code_num(v)
+    for v in (978, "978", " 978 ", b"978", "051"):
+        assert iso4217parse.is_code_num(v, strict=False)
+    for v in (True, 1, "1", "Blaa", None, [], 978.0):
+        assert not iso4217parse.is_code_num(v, strict=False)
+
+
+class Scalar:
+    # like numpy.int64 / numpy.bool_
+    def __init__(self, value):
+        self.value = value
+
+    def item(self):
+        return self.value
+
+
+def test_is_code_num_scalar():
+    assert not iso4217parse.is_code_num(Scalar(978))
+    assert iso4217parse.is_code_num(Scalar(978), strict=False)
+    assert 978 == iso4217parse.validator("code_num", strict=False)(Scalar(978))
+    for v in (Scalar(True), Scalar(1), Scalar(978.0), Scalar(None)):
+        assert not iso4217parse.is_code_num(v, strict=False)
+
+
+def test_is_symbol():
+    for symbol in iso4217parse._data().symbol:
+        assert iso4217parse.is_symbol(symbol)
+    for v in (" €", "€".encode(), "Price is 5 €", None, []):
+        assert not iso4217parse.is_symbol(v)
+    assert iso4217parse.is_symbol(" €", strict=False)
+    assert iso4217parse.is_symbol("€".encode(), strict=False)
+
+
+def test_validate_many():
+    assert [True, False, False] == iso4217parse.validate_many(
+        ["EUR", "eur", None], "alpha3"
+    )
+    assert [True, True, False] == iso4217parse.validate_many(
+        ["EUR", "eur", None], "alpha3", strict=False
+    )
+    assert [True, False] == iso4217parse.validate_many([978, 1234], "code_num")
+    assert [True, False] == iso4217parse.validate_many(["$", "Blaa"], "symbol")
+    with pytest.raises(ValueError):
+        iso4217parse.validate_many([], "name")
+
+
+def test_validator():
+    validate = iso4217parse.validator("alpha3", strict=False)
+    assert "EUR" == validate(" eur")
+    with pytest.raises(ValueError):
+        validate("Blaa")
+
+    validate = iso4217parse.validator("code_num", strict=False)
+    assert 51 == validate(b"051")
+    with pytest.raises(ValueError):
+        iso4217parse.validator("code_num")("051")
+
+    with pytest.raises(ValueError):
+        iso4217parse.validator("name")
+
+
+class Attribute:
+    # like `attrs.Attribute`, validators only use the name
+    name = "currency"
+
+
+def test_attrs_validator_without_attrs():
+    validate = iso4217parse.attrs_validator("code_num", strict=False)
+    assert validate(None, Attribute(), "978") is None
+    with pytest.raises(
+        ValueError, match="`currency` 'Blaa' is not a valid ISO4217 code_num"
+    ):
+        validate(None, Attribute(), "Blaa")
+    with pytest.raises(ValueError):
+        iso4217parse.attrs_validator("code_num")(None, Attribute(), "978")
+
+
+def test_attrs_validator():
+    attrs = pytest.importorskip("attrs")
+
+    @attrs.define
+    class Row:
+        currency: str = attrs.field(validator=iso4217parse.attrs_validator("alpha3"))
+
+    assert "EUR" == Row("EUR").currency
+    with pytest.raises(ValueError, match="`currency` 'eur'"):
+        Row("eur")